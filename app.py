@@ -1,31 +1,331 @@
 import streamlit as st
 from streamlit import session_state as sst
 import pandas as pd
-from datetime import datetime
+import numpy as np
+import time
+from datetime import datetime, date
 from utils.process_github_data import *
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from utils.util import load_css, format_date_ddmmyyyy
+from utils.util import load_css, format_date_ddmmyyyy, downcast_counts, month_names
 from utils.fetch_github_data import *
 from utils.streamlit_ui import base_ui, growth_stats
 
 color = "#26a641"
+day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Define achievements with their criteria and thresholds
+streak_achievements = {
+    "Streak Beginner": {"required": 2, "criteria": "Made contributions for 2 consecutive days"},
+    "Streak Novice": {"required": 7, "criteria": "Made contributions for 7 consecutive days"},
+    "Streak Apprentice": {"required": 14, "criteria": "Made contributions for 14 consecutive days"},
+    "Streak Journeyman": {"required": 30, "criteria": "Made contributions for 30 consecutive days"},
+    "Streak Expert": {"required": 60, "criteria": "Made contributions for 60 consecutive days"},
+    "Streak Master": {"required": 90, "criteria": "Made contributions for 90 consecutive days"},
+    "Streak Legend": {"required": 120, "criteria": "Made contributions for 120+ consecutive days"}
+}
+
+contribution_achievements = {
+    "Contributor": {"required": 50, "criteria": "Made your first 50 contributions"},
+    "Regular Contributor": {"required": 100, "criteria": "Reached 100 total contributions"},
+    "Active Contributor": {"required": 500, "criteria": "Reached 500 total contributions"},
+    "Dedicated Contributor": {"required": 1000, "criteria": "Reached 1,000 total contributions"},
+    "Seasoned Contributor": {"required": 5000, "criteria": "Reached 5,000 total contributions"},
+    "GitHub Legend": {"required": 10000, "criteria": "Reached 10,000+ total contributions"}
+}
+
+# Thresholds as arrays so progress for every achievement is computed in one operation
+streak_thresholds = np.array([details["required"] for details in streak_achievements.values()])
+contribution_thresholds = np.array([details["required"] for details in contribution_achievements.values()])
+
+# Figure builders are cached, so reruns with unchanged data reuse the figures instead of rebuilding them
+@st.cache_data(show_spinner=False)
+def build_monthly_fig(monthly_data: pd.DataFrame) -> go.Figure:
+    """
+    Builds the "Monthly Growth" bar chart.
+
+    Args:
+        monthly_data (pd.DataFrame): Monthly totals with `Year`, `Month` (0 = January) and `Contributions` columns, in calendar order.
+
+    Returns:
+        go.Figure: Plotly bar chart of contributions per month.
+    """
+    fig = go.Figure(go.Bar(
+        x=[f"{month_names[month]} {year}" for year, month in zip(monthly_data["Year"], monthly_data["Month"])],
+        y=downcast_counts(monthly_data["Contributions"]),
+        marker_color=color
+    ))
+    
+    # Update layout for dark theme compatibility
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=False,
+        margin=dict(l=20, r=20, t=20, b=20),
+        height=200,
+        xaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(128,128,128,0.2)'
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(128,128,128,0.2)'
+        )
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_dow_fig(day_totals: pd.Series) -> go.Figure:
+    """
+    Builds the "By Day of Week" horizontal bar chart.
+
+    Args:
+        day_totals (pd.Series): Contributions per weekday, indexed 0 (Monday) to 6 (Sunday).
+
+    Returns:
+        go.Figure: Plotly horizontal bar chart with Monday on top.
+    """
+    # Reverse order for top-to-bottom display (Monday on top)
+    fig = go.Figure(go.Bar(
+        x=downcast_counts(day_totals.to_numpy()[::-1]),
+        y=day_names[::-1],
+        orientation='h',
+        marker_color=color
+    ))
+
+    # Update layout for dark theme compatibility
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        showlegend=False,
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=150,  # Reduce the height of the chart
+        xaxis=dict(showgrid=True, gridcolor='rgba(128,128,128,0.2)'),
+        yaxis=dict(showgrid=False)
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_language_pie(lang_names: tuple, lang_sizes: tuple, colors: tuple) -> go.Figure:
+    """
+    Builds the "Programming Languages" pie chart.
+
+    Args:
+        lang_names (tuple): Language names, largest first, with "Others" last if present.
+        lang_sizes (tuple): Size in bytes of each language's code.
+        colors (tuple): Slice color for each language.
+
+    Returns:
+        go.Figure: Plotly pie chart of code size per language.
+    """
+    fig = go.Figure(go.Pie(
+        labels=lang_names,
+        values=lang_sizes,
+        marker=dict(colors=colors, line=dict(color="white", width=1)),
+        textinfo="percent+label",
+        textfont=dict(color="white", size=12),
+        sort=False,
+        direction="counterclockwise",
+        rotation=90
+    ))
+
+    # Make the figure background transparent
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=False,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+@st.fragment
+def render_contributions_over_time(chart_data: pd.DataFrame):
+    """
+    Renders the "Contributions Over Time" line chart.
+    Runs as a fragment, so flipping the daily resolution toggle reruns only this chart.
+
+    Args:
+        chart_data (pd.DataFrame): Daily contributions with `Date` and `Contributions` columns.
+    """
+    st.markdown("### Contributions Over Time")
+    with st.container(border=True):
+        # Weekly totals by default; the full daily series is only sent to the browser on demand
+        daily_resolution = st.toggle("Show daily resolution", value=False)
+        timeline = chart_data.set_index("Date")["Contributions"]
+        if not daily_resolution:
+            timeline = timeline.resample("W").sum()
+
+        # Plot straight from the NumPy buffers behind the series, in the narrowest dtype Plotly can encode
+        timeline_dates = timeline.index.to_numpy()
+        timeline_counts = downcast_counts(timeline.to_numpy())
+        max_contrib = int(timeline_counts.max())
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=timeline_dates,
+            y=timeline_counts,
+            mode="lines",
+            name="Contributions",
+            line=dict(color=color)
+        ))
+
+        fig.update_layout(
+            xaxis_title="Time Range",
+            yaxis_title="Contributions per day" if daily_resolution else "Contributions per week",
+            yaxis=dict(rangemode="tozero", autorange=True, tick0=0),
+            xaxis=dict(rangeslider=dict(visible=False), type="date"),
+            margin=dict(l=30, r=20, t=30, b=30),
+            hovermode="x unified",
+            template="plotly_white"
+        )
+
+        fig.update_yaxes(
+            range=[0, max_contrib * 1.1 if max_contrib > 0 else 1], 
+            fixedrange=True,
+            autorange=True,
+            rangemode="tozero",
+        )
+        fig.update_xaxes(
+            fixedrange=False,
+            rangeslider=dict(visible=False),
+            type="date",
+            constrain="range",
+        )
+        fig.update_layout(dragmode='zoom')
+
+        st.plotly_chart(fig, width='stretch', config={"scrollZoom": True})
+
+def render_languages(user_data: dict):
+    """
+    Renders the "Programming Languages" pie chart and breakdown table.
+
+    Args:
+        user_data (dict): JSON response from `fetch_user_data`, including repository languages.
+    """
+    st.markdown("### Programming Languages")
+
+    # Repository languages are fetched along with the user data
+    repo_stats = process_language_data(user_data)
+
+    if repo_stats:
+        with st.container(border=True):
+            col1, col2 = st.columns([3,1], vertical_alignment="center", gap="small")
+            # Languages arrive largest first, so the top 6 are simply the first 6
+            top_languages = dict(list(repo_stats.items())[:6])
+
+            # Add "Others" category for remaining languages
+            if len(repo_stats) > len(top_languages):
+                others_size = sum(lang_data['size'] for lang_data in list(repo_stats.values())[6:])
+                top_languages["Others"] = {"size": others_size, "color": "#808080"}  # Gray for "Others"
+
+            # Unpack names, sizes and colors in one pass, shared by the pie chart and the table
+            lang_names, lang_sizes, colors = zip(*(
+                (name, lang_data["size"], lang_data["color"]) for name, lang_data in top_languages.items()
+            ))
+
+            # Create pie chart (rendered client-side by Plotly)
+            fig = build_language_pie(lang_names, lang_sizes, colors)
+            col2.plotly_chart(fig, width='stretch', config={'displayModeBar': False})
+
+            # Display language breakdown in a table
+            col1.markdown("#### Language Breakdown")
+            lang_sizes = np.array(lang_sizes)
+            total = int(lang_sizes.sum()) # "Others" is included, so this covers every language
+            lang_df = pd.DataFrame({
+                "Language": lang_names,
+                "Size (KB)": (lang_sizes / 1024).round(1),
+                "Percentage": [f"{share:.1%}" for share in lang_sizes / total]
+            })
+            col1.dataframe(lang_df, hide_index=True)
+    else:
+        st.warning("No language data available for the user's repositories.")
+
+def build_achievement_markdown(achievements: dict, progress: np.ndarray, unlocked: int, current: int):
+    """
+    Builds the markdown for one group of achievements, so each group renders with two elements instead of several per achievement.
+
+    Args:
+        achievements (dict): Achievements in ascending order of their `required` value.
+        progress (np.ndarray): Progress percentage towards each achievement.
+        unlocked (int): Number of achievements unlocked, always a prefix of `achievements`.
+        current (int): User's current value for this group (streak or total contributions).
+
+    Returns:
+        tuple: (unlocked_md, locked_md) markdown strings; locked_md is empty when everything is unlocked.
+    """
+    items = list(achievements.items())
+    unlocked_md = "  \n".join(
+        f"✅ **:green[{title}]** : *{details['criteria']}*" for title, details in items[:unlocked]
+    )
+
+    locked_rows = [
+        f"| 🔒 **:orange[{title}]** | *{details['criteria']}* | :orange-background[{pct:.1f}%] :blue[{current}/{details['required']}] |"
+        for (title, details), pct in zip(items[unlocked:], progress[unlocked:])
+    ]
+    locked_md = "\n".join(["| Achievement | Criteria | Progress |", "|---|---|---|", *locked_rows]) if locked_rows else ""
+    return unlocked_md, locked_md
+
+def render_achievements(current_streak: int, total_contributions: int):
+    """
+    Renders streak and contribution achievements with progress towards locked ones.
+
+    Args:
+        current_streak (int): Current contribution streak in days.
+        total_contributions (int): All-time total contributions.
+    """
+    st.markdown("### Achievements")
+    with st.container():
+        st.success("Keep growing your GitHub stats to unlock more achievements! 🚀", icon="💪")
+        streak_cont, contr_cont = st.columns(2)
+
+        # Thresholds are ascending, so the unlocked achievements are a prefix
+        streak_progress = np.minimum(100.0, current_streak * (100.0 / streak_thresholds))
+        streaks_unlocked = int(np.searchsorted(streak_thresholds, current_streak, side="right"))
+        contribution_progress = np.minimum(100.0, total_contributions * (100.0 / contribution_thresholds))
+        contributions_unlocked = int(np.searchsorted(contribution_thresholds, total_contributions, side="right"))
+
+        groups = [
+            (streak_cont, "🔥 Streak Achievements", streak_achievements, streak_progress, streaks_unlocked, current_streak),
+            (contr_cont, "🏆 Contribution Achievements", contribution_achievements, contribution_progress, contributions_unlocked, total_contributions),
+        ]
+        for cont, subheader, achievements, progress, unlocked, current in groups:
+            with cont.container(border=True):
+                st.subheader(subheader)
+                unlocked_md, locked_md = build_achievement_markdown(achievements, progress, unlocked, current)
+                if unlocked_md:
+                    st.markdown(unlocked_md)
+                with st.expander(label="Locked Achievements", icon="🔒"):
+                    st.markdown(locked_md or "All achievements unlocked! 🎉")
 
 def main():
     base_ui() # Base UI containing title, star button and sidebar form
     
     if sst.username and sst.token and sst.button_pressed:
-        # Fetch data
-        cont_data = fetch_contribution_data(sst.username, sst.token)
-        user_data = fetch_user_data(sst.username, sst.token)
-        repo_data = fetch_repo_data(sst.username, sst.token)
-
-        if "errors" in cont_data or "errors" in user_data or "errors" in repo_data:
+        # Read the clock once per run
+        now = datetime.now()
+        this_year = now.year
+        today = now.strftime("%Y-%m-%d")
+
+        # Reruns with the same input on the same day reuse the processed results kept in session state.
+        # They expire after CACHE_TTL like the fetch caches, so they never outlive the responses they came from
+        fetch_key = (sst.username, sst.token, today)
+        if sst.last_fetch_key != fetch_key or time.time() - sst.last_fetch_time >= CACHE_TTL:
+            # Fetch data (contribution history and user data are fetched concurrently)
+            cont_data, user_data = fetch_all_data(sst.username, sst.token)
+            cont_stats = user_stats = None
+            if "errors" not in cont_data and "errors" not in user_data:
+                # Process data
+                cont_stats = process_contribution_data(cont_data)
+                user_stats = process_user_data(user_data)
+                # Only successful results are remembered; failed fetches are not cached either, so they are retried on the next run
+                sst.last_fetch_key = fetch_key
+                sst.last_fetch_time = time.time()
+            sst.last_fetch = (cont_data, user_data, cont_stats, user_stats)
+        cont_data, user_data, cont_stats, user_stats = sst.last_fetch
+
+        if "errors" in cont_data or "errors" in user_data:
             st.error("Error fetching data. Check your username/token.")
         else:
-            # Process data
-            cont_stats = process_contribution_data(cont_data)
-            user_stats = process_user_data(user_data)
 
             # --- User Stats Summary ---
             st.markdown("### User Summary")
@@ -40,20 +340,17 @@ def main():
                     repositories = user_stats.get("repositories")
                     total_prs = cont_stats.get("total_pullrequests")
                     total_issues = cont_stats.get("total_issues")
-                    created_at = datetime.strptime(user_stats.get("created_at"), "%Y-%m-%dT%H:%M:%SZ")
-                    created_at = created_at.strftime("%Y-%m-%d")
+                    created_at = date.fromisoformat(user_stats.get("created_at")[:10])
 
+                    # Stylesheet and user card are sent in a single markdown element
                     custom_css = load_css()
                     st.markdown(f"""
                                 <style>
                                 {custom_css}
                                 </style>
-                                """, unsafe_allow_html=True)
-
-                    st.markdown(f"""
                                 <div class="user-container">
                                     <div class="user-card">
-                                        <img src="{avatar_url}" alt="Avatar" class="avatar">
+                                        <img src="{avatar_url}" alt="Avatar" class="avatar" width="80" height="80" decoding="async">
                                         <div class="username">{sst.username}</div>
                                         <div class="bio">{user_bio}</div>
                                         <div class="stats">
@@ -78,7 +375,8 @@ def main():
                     today_commits = cont_stats.get("today_commits", 0)
                     current_streak = cont_stats.get("current_streak", 0)
                     longest_streak = cont_stats.get("longest_streak", 0)
-                    days = cont_stats.get("days", [])
+                    dates = cont_stats.get("dates")
+                    counts = cont_stats.get("counts")
 
             
                     # Validate contribution data
@@ -139,68 +437,43 @@ def main():
                     
 
             # Prepare data for visualizations
-            if not days:
+            if counts.size == 0:
                 st.warning("No contribution data available for visualizations.")
             else:
-                dates = [datetime.strptime(day["date"], "%Y-%m-%d") for day in days]
-                # Add private contributions to daily counts if enabled
-                contributions = [day.get("contributionCount", 0) for day in days]
+                # Dates are already parsed, so the frame wraps the arrays directly
+                chart_data = pd.DataFrame({"Date": dates, "Contributions": counts})
+
+                # Derive every grouping column once, up front
+                date_parts = chart_data["Date"].dt
+                chart_data = chart_data.assign(
+                    Year=date_parts.year.astype(np.int16),
+                    Month=(date_parts.month - 1).astype(np.int8), # 0 = January ... 11 = December
+                    DayOfWeek=date_parts.dayofweek.astype(np.int8), # 0 = Monday ... 6 = Sunday
+                )
+
+                # One pass over the daily rows; every chart below is derived from this small aggregate
+                daily = chart_data.groupby(["Year", "Month", "DayOfWeek"])["Contributions"].sum()
+                # Contributions by day of the week, filling days without data
+                day_totals = pd.Series(np.bincount(
+                    daily.index.get_level_values("DayOfWeek"), weights=daily.to_numpy(), minlength=7
+                ).astype(np.int64))
 
                 # --- Contributions Over Time ---
-                st.markdown("### Contributions Over Time")
-                with st.container(border=True):
-                    chart_data = pd.DataFrame({"Date": dates, "Contributions": contributions})
-                    max_contrib = int(chart_data.Contributions.max() if not chart_data.empty else 1)
-                    fig = go.Figure()
-                    fig.add_trace(go.Scatter(
-                        x=chart_data["Date"],
-                        y=chart_data["Contributions"],
-                        mode="lines",
-                        name="Contributions",
-                        line=dict(color=color)
-                    ))
-
-                    fig.update_layout(
-                        xaxis_title="Time Range",
-                        yaxis_title="Contribution Count",
-                        yaxis=dict(rangemode="tozero", autorange=True, tick0=0),
-                        xaxis=dict(rangeslider=dict(visible=False), type="date"),
-                        margin=dict(l=30, r=20, t=30, b=30),
-                        hovermode="x unified",
-                        template="plotly_white"
-                    )
-
-                    fig.update_yaxes(
-                        range=[0, max_contrib * 1.1 if max_contrib > 0 else 1], 
-                        fixedrange=True,
-                        autorange=True,
-                        rangemode="tozero",
-                    )
-                    fig.update_xaxes(
-                        fixedrange=False,
-                        rangeslider=dict(visible=False),
-                        type="date",
-                        constrain="range",
-                    )
-                    fig.update_layout(dragmode='zoom')
-
-                    st.plotly_chart(fig, width='stretch', config={"scrollZoom": True})
+                render_contributions_over_time(chart_data)
 
                 # --- Growth and Statistics ---
 
                 st.markdown("### Growth and Statistics")
                 with st.container():
-                    # Fetch data
-                    chart_data['Year'] = chart_data['Date'].dt.year
-                    yearly_contributions = chart_data.groupby('Year')['Contributions'].sum().round(1)  # Round to 1 decimal
+                    yearly_contributions = daily.groupby("Year").sum()
                     
                     # ------------- Last Year Contributions
                     with st.container(border=True):
-                        st.markdown(f"#### :material/calendar_month: **Contributions in {datetime.now().year-1}:**")
+                        st.markdown(f"#### :material/calendar_month: **Contributions in {this_year-1}:**")
                         
                         # --- 365 days stats ---
-                        last_jan1st = datetime(datetime.now().year-1, 1, 1).strftime("%Y-%m-%d")
-                        last_dec31st = datetime(datetime.now().year-1, 12, 31).strftime("%Y-%m-%d")
+                        last_jan1st = date(this_year-1, 1, 1)
+                        last_dec31st = date(this_year-1, 12, 31)
                         
                         last_year_data_present = True
                         from_date= last_jan1st# Date comes before Jan 1st. We use Jan 1st as starting date
@@ -213,14 +486,22 @@ def main():
                         elif created_at >= last_dec31st:
                             last_year_data_present = False
 
+                        # Current year starts from Jan 1st or the join date, whichever is later
+                        current_jan1st = date(this_year, 1, 1)
+                        current_from_date= created_at
+                        if current_jan1st >= created_at: # If joined before Jan 1st
+                            current_from_date= current_jan1st
+
+                        # Fetch last year and current year data in a single request
+                        ranges = {"thisYear": (current_from_date.isoformat(), today)}
+                        if last_year_data_present:
+                            ranges["lastYear"] = (from_date.isoformat(), to_date.isoformat())
+                        range_data = fetch_multi_range(sst.username, sst.token, ranges, include_totals=False)
+                        year_data = range_data.get("lastYear", range_data)
+                        current_year_data = range_data.get("thisYear", range_data)
+
                         # If last year data is present    
                         if last_year_data_present:
-                            year_data = fetch_data_for_duration(
-                                sst.username, 
-                                sst.token,
-                                from_date= from_date,
-                                to_date= to_date
-                            )
                             # Process data
                             whole_year_stats = analyze_contributions(year_data)
 
@@ -229,7 +510,7 @@ def main():
                             contribution_rate_ly = whole_year_stats.get('contribution_rate')
                             active_days_ly = whole_year_stats.get('active_days')
                             percent_active_days_ly = (whole_year_stats.get('active_days')/total_days_ly)*100
-                            since = f'`since {format_date_ddmmyyyy(from_date)}`' if from_date != last_jan1st else ''
+                            since = f'`since {format_date_ddmmyyyy(from_date.isoformat())}`' if from_date != last_jan1st else ''
                             growth_stats(
                                 total_contributions=total_contributions_ly, 
                                 contribution_rate=contribution_rate_ly, 
@@ -238,22 +519,11 @@ def main():
                                 percent_active_days=percent_active_days_ly, 
                                 since=since)
                         else:
-                            st.info(f"No Data for year {datetime.now().year-1}")
+                            st.info(f"No Data for year {this_year-1}")
                         
                         # --- Current year stats ---
-                        st.markdown(f"#### :material/calendar_today: **Contributions in {datetime.now().year}:**")
-                        today = datetime.now().strftime("%Y-%m-%d")
-                        current_jan1st = datetime(datetime.now().year, 1, 1).strftime("%Y-%m-%d")
-                        from_date= created_at
-                        # Fetching current year data
-                        if current_jan1st >= created_at: # If joined before Jan 1st
-                            from_date= current_jan1st
-                        current_year_data = fetch_data_for_duration(
-                            sst.username, 
-                            sst.token,
-                            from_date= from_date,
-                            to_date= today
-                            )
+                        st.markdown(f"#### :material/calendar_today: **Contributions in {this_year}:**")
+                        from_date= current_from_date
 
                         # Process data
                         current_year_stats = analyze_contributions(current_year_data)
@@ -263,7 +533,7 @@ def main():
                         contribution_rate = current_year_stats.get('contribution_rate')
                         active_days = current_year_stats.get('active_days')
                         percent_active_days = (current_year_stats.get('active_days')/total_days)*100
-                        since = f'`since {format_date_ddmmyyyy(from_date)}`' if from_date != current_jan1st else ''
+                        since = f'`since {format_date_ddmmyyyy(from_date.isoformat())}`' if from_date != current_jan1st else ''
 
                         growth_stats(
                             total_contributions=total_contributions,
@@ -283,215 +553,35 @@ def main():
                     # Display monthly growth visualization in Jan-2023 format
                     with st.container(border=True):
                         st.markdown("### Monthly Growth")
-                        # Convert dates to datetime format
-                        chart_data["Date"] = pd.to_datetime(chart_data["Date"])
-                        
-                        # Create year and month columns for grouping
-                        chart_data["Sort_Key"] = chart_data["Date"].dt.strftime("%Y-%m")
-                        
-                        # Group and aggregate
-                        monthly_data = chart_data.groupby("Sort_Key")["Contributions"].sum().reset_index()
-                        monthly_data["Display_Date"] = pd.to_datetime(monthly_data["Sort_Key"] + "-01")
-                        monthly_data = monthly_data.sort_values("Display_Date")
-                        
-                        # Create Plotly bar chart
-                        fig = go.Figure(go.Bar(
-                            x=monthly_data["Display_Date"].dt.strftime("%b %Y"),
-                            y=monthly_data["Contributions"],
-                            marker_color=color
-                        ))
-                        
-                        # Update layout for dark theme compatibility
-                        fig.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            font_color='white',
-                            showlegend=False,
-                            margin=dict(l=20, r=20, t=20, b=20),
-                            height=200,
-                            xaxis=dict(
-                                showgrid=True,
-                                gridcolor='rgba(128,128,128,0.2)'
-                            ),
-                            yaxis=dict(
-                                showgrid=True,
-                                gridcolor='rgba(128,128,128,0.2)'
-                            )
-                        )
+                        # Group and aggregate (integer keys already sort in calendar order)
+                        monthly_data = daily.groupby(["Year", "Month"]).sum().reset_index()
                         
                         # Display the Plotly chart
+                        fig = build_monthly_fig(monthly_data)
                         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
                     # --- Weekday vs. Weekend Contributions ---
                     col2.markdown("### Weekday vs. Weekend")
                     with col2.container(border=True):
-                        chart_data['IsWeekend'] = chart_data['Date'].dt.dayofweek >= 5
-                        weekend_data = chart_data.groupby('IsWeekend')['Contributions'].sum().round(1)
-                        weekend_data.index = ["Weekdays", "Weekends"]
+                        # Monday-Friday are weekday indices 0-4
+                        weekend_data = pd.Series(
+                            [day_totals.iloc[:5].sum(), day_totals.iloc[5:].sum()],
+                            index=["Weekdays", "Weekends"]
+                        )
                         st.bar_chart(weekend_data, color=color, horizontal=True)
 
                     # --- Contributions by Day of Week ---
                     col2.markdown("### By Day of Week")
                     with col2.container(border=True):
-                        # Ensure the 'Date' column is properly converted to datetime
-                        chart_data["Date"] = pd.to_datetime(chart_data["Date"])
-                        chart_data["Day"] = chart_data["Date"].dt.day_name()
-
-                        # Aggregate contributions by day of the week
-                        day_totals = chart_data.groupby("Day")["Contributions"].sum()
-
-                        # Create ordered lists for plotting (reversed order for top-to-bottom display)
-                        correct_order = ["Sunday", "Saturday", "Friday", "Thursday", "Wednesday", "Tuesday", "Monday"]
-                        values = [day_totals.get(day, 0) for day in correct_order]
-
-                        # Create Plotly bar chart
-                        fig = go.Figure(go.Bar(
-                            x=values,
-                            y=correct_order,
-                            orientation='h',
-                            marker_color=color
-                        ))
-
-                        # Update layout for dark theme compatibility
-                        fig.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            font_color='white',
-                            showlegend=False,
-                            margin=dict(l=0, r=0, t=0, b=0),
-                            height=150,  # Reduce the height of the chart
-                            xaxis=dict(showgrid=True, gridcolor='rgba(128,128,128,0.2)'),
-                            yaxis=dict(showgrid=False)
-                        )
-
                         # Display the Plotly chart
+                        fig = build_dow_fig(day_totals)
                         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
             # Add Language Distribution
-            st.markdown("### Programming Languages")
-
-            # Fetch repository stats
-            repo_stats = process_language_data(repo_data)
-            
-            if repo_stats:
-                with st.container(border=True):
-                    col1, col2 = st.columns([3,1], vertical_alignment="center", gap="small")
-                    # Sort languages by count and take top 6 languages
-                    sorted_data = dict(sorted(repo_stats.items(), key=lambda x: x[1]['count'], reverse=True))
-                    top_languages = dict(list(sorted_data.items())[:6])
-                    
-                    # Add "Others" category for remaining languages
-                    remaining_languages = dict(list(sorted_data.items())[6:])
-                    if remaining_languages:
-                        others_count = sum(lang_data['count'] for lang_data in remaining_languages.values())
-                        top_languages["Others"] = {"count": others_count, "color": "#808080"}  # Gray for "Others"
-                    
-                    # Create figure with fixed size
-                    fig, ax = plt.subplots(figsize=(8, 8))
-                    
-                    # Calculate percentages
-                    total = sum(lang_data["count"] for lang_data in sorted_data.values())
-                    
-                    # Extract colors from processed data
-                    colors = [lang_data["color"] for lang_data in top_languages.values()]
-                    
-                    # Create pie chart
-                    wedges, texts, autotexts = ax.pie(
-                        [lang_data["count"] for lang_data in top_languages.values()],
-                        labels=top_languages.keys(),
-                        autopct='%1.1f%%',
-                        startangle=90,
-                        colors=colors,
-                        textprops={'color': 'white', 'fontsize': 12},
-                        wedgeprops={'edgecolor': 'white', 'linewidth': 1}
-                    )
-                    
-                    ax.axis('equal')
-                    
-                    # Make the figure background transparent
-                    fig.patch.set_alpha(0.0)
-                    ax.patch.set_alpha(0.0)
-                    
-                    col2.pyplot(fig)
-                    
-                    # Display language breakdown in a table
-                    col1.markdown("#### Language Breakdown")
-                    lang_df = pd.DataFrame({
-                        "Language": top_languages.keys(),
-                        "Repositories": [lang_data["count"] for lang_data in top_languages.values()],
-                        "Percentage": [f"{lang_data['count'] / total:.1%}" for lang_data in top_languages.values()]
-                    })
-                    col1.dataframe(lang_df, hide_index=True)
-            else:
-                st.warning("No language data available for the user's repositories.")
+            render_languages(user_data)
 
             # Custom Achievements (based on visible contributions)
-            st.markdown("### Achievements")
-            with st.container():
-                st.success("Keep growing your GitHub stats to unlock more achievements! 🚀", icon="💪")
-                streak_cont, contr_cont = st.columns(2)
-                # Define achievements with their criteria and thresholds
-                streak_achievements = {
-                    "Streak Beginner": {"required": 2, "criteria": "Made contributions for 2 consecutive days"},
-                    "Streak Novice": {"required": 7, "criteria": "Made contributions for 7 consecutive days"},
-                    "Streak Apprentice": {"required": 14, "criteria": "Made contributions for 14 consecutive days"},
-                    "Streak Journeyman": {"required": 30, "criteria": "Made contributions for 30 consecutive days"},
-                    "Streak Expert": {"required": 60, "criteria": "Made contributions for 60 consecutive days"},
-                    "Streak Master": {"required": 90, "criteria": "Made contributions for 90 consecutive days"},
-                    "Streak Legend": {"required": 120, "criteria": "Made contributions for 120+ consecutive days"}
-                }
-
-                contribution_achievements = {
-                    "Contributor": {"required": 50, "criteria": "Made your first 50 contributions"},
-                    "Regular Contributor": {"required": 100, "criteria": "Reached 100 total contributions"},
-                    "Active Contributor": {"required": 500, "criteria": "Reached 500 total contributions"},
-                    "Dedicated Contributor": {"required": 1000, "criteria": "Reached 1,000 total contributions"},
-                    "Seasoned Contributor": {"required": 5000, "criteria": "Reached 5,000 total contributions"},
-                    "GitHub Legend": {"required": 10000, "criteria": "Reached 10,000+ total contributions"}
-                }
-
-                # Display Streak Achievements
-                with streak_cont.container(border=True):
-                    st.subheader("🔥 Streak Achievements")
-                    com_cont = st.container(border=False)
-                    inc_exp = st.expander(label="Locked Achievements", icon="🔒")
-                    current_streak = current_streak
-                    
-                    for title, details in streak_achievements.items():
-                        progress = min(100, (current_streak / details["required"]) * 100)
-                        if current_streak >= details["required"]:
-                            emoji = "✅"
-                            com_cont.markdown(f"{emoji} **:green[{title}]** : *{details['criteria']}*")
-                        else:
-                            emoji = "🔒"
-                            col1, col2 = inc_exp.columns([2, 1])
-                            col1.markdown(f"{emoji} **:orange[{title}]**")
-                            col1.markdown(f"*{details['criteria']}*")
-                            col2.markdown(f"**Progress: :orange[:orange-background[{progress:.1f}%]]**")
-                            if progress > 0:
-                                inc_exp.progress(progress / 100, text=f":blue[{current_streak}/{details['required']}]")
-                                inc_exp.divider()
-
-                # Display Contribution Achievements
-                total_contributions = cont_stats.get("total_contributions", 0)
-                with contr_cont.container(border=True):
-                    st.subheader("🏆 Contribution Achievements")
-                    com_cont = st.container(border=False)
-                    inc_exp = st.expander(label="Locked Achievements", icon="🔒")
-                    for title, details in contribution_achievements.items():
-                        progress = min(100, (total_contributions / details["required"]) * 100)
-                        if total_contributions >= details["required"]:
-                            emoji = "✅"
-                            com_cont.markdown(f"{emoji} **:green[{title}]** : *{details['criteria']}*")
-                        else:
-                            emoji = "🔒"
-                            col1, col2 = inc_exp.columns([2, 1])
-                            col1.markdown(f"{emoji} **:orange[{title}]**")
-                            col1.markdown(f"*{details['criteria']}*")
-                            col2.markdown(f"**Progress: :orange[:orange-background[{progress:.1f}%]]** ")
-                            if progress > 0:
-                                inc_exp.progress(progress / 100, text=f":blue[{total_contributions}/{details['required']}]")
-                                inc_exp.divider()
+            render_achievements(current_streak, cont_stats.get("total_contributions", 0))
     else:
         st.success("ℹ️ ***Enter your GitHub username in the sidebar to see your stats.***")
 
@@ -1,9 +1,9 @@
 import streamlit as st
 from streamlit import session_state as sst
-from datetime import datetime
-from utils.fetch_github_data import fetch_data_for_duration, fetch_user_data
+from datetime import date
+from utils.fetch_github_data import fetch_multi_range, fetch_user_data
 from utils.process_github_data import analyze_contributions, process_user_data
-from utils.util import predict_days_to_milestone, get_milestone_dates, format_date_ddmmyyyy
+from utils.util import predict_days_to_milestone, get_contribution_arrays, get_milestone_dates, format_dates_ddmmyyyy
 from utils.streamlit_ui import base_ui
 
 def main():
@@ -13,14 +13,14 @@ def main():
         # Fetch data
         user_data = fetch_user_data(sst.username, sst.token)
         user_stats = process_user_data(user_data)
-        created_at = datetime.strptime(user_stats.get("created_at"), "%Y-%m-%dT%H:%M:%SZ")
-        created_at = created_at.strftime("%Y-%m-%d")
+        created_at = date.fromisoformat(user_stats.get("created_at")[:10])
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        current_year = datetime.now().year
-        current_jan1st = datetime(current_year, 1, 1).strftime("%Y-%m-%d")
-        last_jan1st = datetime(current_year-1, 1, 1).strftime("%Y-%m-%d")
-        last_dec31st = datetime(current_year-1, 12, 31).strftime("%Y-%m-%d")
+        # Read the clock once so every date below agrees, even across midnight
+        today = date.today()
+        current_year = today.year
+        current_jan1st = date(current_year, 1, 1)
+        last_jan1st = date(current_year-1, 1, 1)
+        last_dec31st = date(current_year-1, 12, 31)
 
         # ------------- Last Year Contributions
         last_year_data_present = True
@@ -33,18 +33,24 @@ def main():
         # Date comes after Dec 31st. Unable to calculate rate for last year
         elif created_at >= last_dec31st:
             last_year_data_present = False
-        
+
+        # -------------- Current Year Data
+        current_from_date= created_at
+        if current_jan1st >= created_at: # If joined before Jan 1st
+            current_from_date= current_jan1st
+
+        # Fetch last year and current year data in a single request.
+        # Same ranges as the dashboard's growth section, so the cached response is shared.
+        ranges = {"thisYear": (current_from_date.isoformat(), today.isoformat())}
+        if last_year_data_present:
+            ranges["lastYear"] = (from_date.isoformat(), to_date.isoformat())
+        range_data = fetch_multi_range(sst.username, sst.token, ranges, include_totals=False)
+        current_year_data = range_data.get("thisYear", range_data)
             
         # If last year data is present
         if last_year_data_present:
-            year_data = fetch_data_for_duration(
-                sst.username, 
-                sst.token,
-                from_date= from_date,
-                to_date= to_date
-            )
             # Analyze only when data present
-            whole_year_stats = analyze_contributions(year_data)
+            whole_year_stats = analyze_contributions(range_data.get("lastYear", range_data))
 
             # --- Get required stats ---
             contribution_rate_ly = whole_year_stats.get('contribution_rate', 0)
@@ -54,19 +60,6 @@ def main():
             contribution_rate_ly = 0
             total_contributions_ly = 0
 
-
-        # -------------- Current Year Data
-        from_date= created_at
-        # Fetching current year data
-        if current_jan1st >= created_at: # If joined before Jan 1st
-            from_date= current_jan1st
-        current_year_data = fetch_data_for_duration(
-            sst.username, 
-            sst.token,
-            from_date= from_date,
-            to_date= today
-            )
-        
         # Process current year data
         current_year_stats = analyze_contributions(current_year_data)
         
@@ -87,9 +80,11 @@ def main():
         # else:
         #     active_days_growth = ((active_days - active_days_ly) / active_days_ly) * 100  # Growth in %
 
-        remaining_days = 365 - total_days
+        remaining_days = (date(current_year, 12, 31) - today).days # Leap-year aware
+        # Share of days with contributions so far; empty year data predicts no further active days
+        active_rate = (active_days / total_days) if total_days else 0.0
         predicted_future_contributions = contribution_rate * remaining_days
-        predicted_future_active_days = (active_days / total_days) * remaining_days
+        predicted_future_active_days = active_rate * remaining_days
 
 
         with st.container():
@@ -129,8 +124,9 @@ def main():
             if contributions_left < 0: # Already doing better than last year
                 st.success("Keep it up! You're already doing better than last year")
             else:
-                rate_for_rem_days = contributions_left/remaining_days
-                rate_for_active_days = contributions_left/predicted_future_active_days
+                # On Dec 31st no days remain after today, so the whole gap falls on today
+                rate_for_rem_days = contributions_left/remaining_days if remaining_days else float(contributions_left)
+                rate_for_active_days = contributions_left/predicted_future_active_days if predicted_future_active_days else 0.0
 
                 st.markdown("#### :material/graph_1: Contribution Gap")
                 colrem, colact = st.columns(2, border=True)
@@ -159,58 +155,44 @@ def main():
             if current_contributions == 0:
                 st.error("No contributions found for the current year.")
                 st.stop()
-            # Calculate days required for each milestone
-            milestone_predictions = {
-                milestone: predict_days_to_milestone(current_contributions, milestone, contribution_rate)
-                for milestone in milestones
-            }
-
-            contributions = current_year_data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
-
-            milestone_dates = get_milestone_dates(milestones, contributions, total_contributions, contribution_rate)
-
-
-            # Display Milestones
-        
-
-            col1, col2 = st.columns(2, border=True)
-
-            for i, (milestone, days) in enumerate(milestone_predictions.items()):
-                col = col1 if i % 2 == 0 else col2  # Alternate between columns
-                if total_contributions >= milestone:
-                    # Unlocked Milestone
-                    status = milestone_dates.get(milestone, 'Not Achieveable')
-                    date = ''
-                    if status != 'Not Achieveable':
-                        date = format_date_ddmmyyyy(status)
-                    col.metric(
-                        label=f"✅ Achieved Milestone: {milestone} commits",
-                        value=f"{date}" if date else "Achieved",
-                        delta="Achieved",
-                    )
-                    col.progress(100, text=f"{total_contributions}/{milestone}")
-                    col.divider()
-                    
-
-                
+            # Calculate days required for every milestone at once
+            days_required = predict_days_to_milestone(current_contributions, milestones, contribution_rate)
+
+            weeks = current_year_data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
+            dates, counts = get_contribution_arrays(weeks)
+
+            # Exact and estimated dates as one datetime64 array, formatted in a single pass
+            milestone_dates = get_milestone_dates(milestones, dates, counts, total_contributions, contribution_rate)
+            formatted_dates = format_dates_ddmmyyyy(milestone_dates)
+
+            # One table row per milestone, so the whole grid reaches the browser as a single element
+            milestone_rows = []
+            for milestone, days, milestone_date in zip(milestones, days_required.tolist(), formatted_dates):
+                achieved = total_contributions >= milestone
+                if achieved:
+                    days_left = "Achieved"
                 else:
-                    progress = min(100, (total_contributions / milestone) * 100)
-                    # Locked Milestone with Progress Bar
-                    status = milestone_dates.get(milestone, 'Not Achieveable')
-                    date = ''
-                    if status != 'Not Achieveable':
-                        date = format_date_ddmmyyyy(status)
-                    col.metric(
-                        label=f"Estimated days to {milestone} commits",
-                        value=f"{date}" if date else "Not achievable",
-                        delta=f"{days:.0f} days" if days != float('inf') else "Not achievable"
-                    )
-
-                    if progress > 0:
-                        col.progress(progress / 100, text=f"{total_contributions}/{milestone}")
-                        col.divider()
-
+                    days_left = f"{days:.0f} days" if days != float('inf') else "Not achievable"
+                milestone_rows.append({
+                    "Milestone": f"{milestone} commits",
+                    "Status": "✅ Achieved" if achieved else "🔒 Locked",
+                    "Date": milestone_date or ("Achieved" if achieved else "Not achievable"),
+                    "Days Left": days_left,
+                    "Commits": f"{min(total_contributions, milestone)}/{milestone}",
+                    "Progress": min(100, (total_contributions / milestone) * 100),
+                })
 
+            # Display Milestones
+            st.dataframe(
+                milestone_rows,
+                hide_index=True,
+                width="stretch",
+                column_config={
+                    "Progress": st.column_config.ProgressColumn(
+                        "Progress", min_value=0, max_value=100, format="%.0f%%"
+                    ),
+                },
+            )
 
     else:
         st.info("ℹ️ ***Enter your GitHub username in the sidebar to see your stats.***")
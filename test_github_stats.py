@@ -1,60 +1,93 @@
 import unittest
-from process_github_data import process_language_data
+import numpy as np
+from datetime import date
+from utils.process_github_data import process_language_data
+from utils.util import get_streaks, get_contribution_arrays, format_date_ddmmyyyy, format_dates_ddmmyyyy, get_milestone_dates
 
 class TestGitHubStats(unittest.TestCase):
-    def setUp(self):
-        # Mock data for testing
-        self.mock_data = {
-            "data": {
-                "user": {
-                    "repositories": {
-                        "edges": [
-                            {
-                                "node": {
-                                    "name": "repo1",
-                                    "primaryLanguage": {
-                                        "name": "Python",
-                                        "color": "#3572A5"
-                                    }
+    # Read-only mock data, built once for the whole class
+    mock_data = {
+        "data": {
+            "user": {
+                "repositories": {
+                    "edges": [
+                        {
+                            "node": {
+                                "name": "repo1",
+                                "languages": {
+                                    "edges": [
+                                        {
+                                            "size": 3000,
+                                            "node": {
+                                                "name": "Python",
+                                                "color": "#3572A5"
+                                            }
+                                        },
+                                        {
+                                            "size": 1000,
+                                            "node": {
+                                                "name": "JavaScript",
+                                                "color": "#f1e05a"
+                                            }
+                                        }
+                                    ]
                                 }
-                            },
-                            {
-                                "node": {
-                                    "name": "repo2",
-                                    "primaryLanguage": {
-                                        "name": "JavaScript",
-                                        "color": "#f1e05a"
-                                    }
+                            }
+                        },
+                        {
+                            "node": {
+                                "name": "repo2",
+                                "languages": {
+                                    "edges": [
+                                        {
+                                            "size": 500,
+                                            "node": {
+                                                "name": "JavaScript",
+                                                "color": "#f1e05a"
+                                            }
+                                        }
+                                    ]
                                 }
-                            },
-                            {
-                                "node": {
-                                    "name": "repo3",
-                                    "primaryLanguage": {
-                                        "name": "Python",
-                                        "color": "#3572A5"
-                                    }
+                            }
+                        },
+                        {
+                            "node": {
+                                "name": "repo3",
+                                "languages": {
+                                    "edges": [
+                                        {
+                                            "size": 2000,
+                                            "node": {
+                                                "name": "Python",
+                                                "color": "#3572A5"
+                                            }
+                                        }
+                                    ]
                                 }
-                            },
-                            {
-                                "node": {
-                                    "name": "repo4",
-                                    "primaryLanguage": None
+                            }
+                        },
+                        {
+                            "node": {
+                                "name": "repo4",
+                                "languages": {
+                                    "edges": []
                                 }
                             }
-                        ]
-                    }
+                        }
+                    ]
                 }
             }
         }
+    }
 
     def test_process_language_data(self):
         # Test normal case
         result = process_language_data(self.mock_data)
         self.assertIsNotNone(result)
-        self.assertEqual(result["Python"], 2)
-        self.assertEqual(result["JavaScript"], 1)
-        self.assertEqual(len(result), 2)  # Should not count None language
+        self.assertEqual(result["Python"]["size"], 5000)
+        self.assertEqual(result["JavaScript"]["size"], 1500)
+        self.assertEqual(list(result), ["Python", "JavaScript"])  # Largest first
+        self.assertEqual(len(result), 2)  # Repositories without languages add nothing
 
     def test_process_language_data_empty(self):
         # Test with empty data
@@ -76,5 +109,92 @@ class TestGitHubStats(unittest.TestCase):
         result = process_language_data(invalid_data)
         self.assertIsNone(result)
 
+class TestStreaks(unittest.TestCase):
+    def calendar(self, counts):
+        # Consecutive days ending today, shaped like get_contribution_arrays' output
+        today = np.datetime64(date.today(), "D")
+        dates = today - np.arange(len(counts) - 1, -1, -1)
+        return dates, np.array(counts, dtype=np.int32)
+
+    def test_no_contributions(self):
+        self.assertEqual(get_streaks(*self.calendar([0, 0, 0, 0])), (0, 0))
+
+    def test_streak_ending_today(self):
+        self.assertEqual(get_streaks(*self.calendar([0, 1, 2, 3])), (3, 3))
+
+    def test_streak_ending_yesterday(self):
+        # Today has no contributions yet, but yesterday's streak is still alive
+        self.assertEqual(get_streaks(*self.calendar([1, 0, 4, 5, 0])), (2, 2))
+
+    def test_streak_ending_two_days_ago(self):
+        self.assertEqual(get_streaks(*self.calendar([1, 2, 0, 0])), (0, 2))
+
+    def test_longest_streak_in_the_middle(self):
+        counts = [1, 0, 2, 3, 1, 5, 0, 0, 1, 1]
+        self.assertEqual(get_streaks(*self.calendar(counts)), (2, 4))
+
+class TestFormatDates(unittest.TestCase):
+    def test_suffixes(self):
+        days = ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-04", "2025-01-11",
+                "2025-01-12", "2025-01-13", "2025-01-21", "2025-01-22", "2025-01-23", "2025-01-31"]
+        formatted = format_dates_ddmmyyyy(np.array(days, dtype="datetime64[D]"))
+        self.assertEqual(formatted, [
+            "1st Jan, 2025", "2nd Jan, 2025", "3rd Jan, 2025", "4th Jan, 2025", "11th Jan, 2025",
+            "12th Jan, 2025", "13th Jan, 2025", "21st Jan, 2025", "22nd Jan, 2025", "23rd Jan, 2025", "31st Jan, 2025",
+        ])
+        # Same output as the scalar formatter
+        self.assertEqual(formatted, [format_date_ddmmyyyy(day) for day in days])
+
+    def test_nat(self):
+        dates = np.array(["2024-02-29", "NaT", "1999-12-31"], dtype="datetime64[D]")
+        self.assertEqual(format_dates_ddmmyyyy(dates), ["29th Feb, 2024", "", "31st Dec, 1999"])
+
+    def test_empty(self):
+        self.assertEqual(format_dates_ddmmyyyy(np.array([], dtype="datetime64[D]")), [])
+
+class TestMilestoneDates(unittest.TestCase):
+    dates = np.array(["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-04"], dtype="datetime64[D]")
+    counts = np.array([40, 0, 60, 10], dtype=np.int32)  # Running total: 40, 40, 100, 110
+
+    def test_achieved_milestones(self):
+        result = get_milestone_dates([10, 40, 41, 100], self.dates, self.counts, 110, 1.0)
+        self.assertEqual([str(d) for d in result], ["2025-01-01", "2025-01-01", "2025-01-03", "2025-01-03"])
+
+    def test_zero_rate(self):
+        # Unachieved milestones cannot be estimated without contributions
+        result = get_milestone_dates([100, 500, 1000], self.dates, self.counts, 110, 0)
+        self.assertEqual(str(result[0]), "2025-01-03")
+        self.assertTrue(np.isnat(result[1:]).all())
+
+    def test_estimated_milestones(self):
+        today = np.datetime64(date.today(), "D")
+        result = get_milestone_dates([100, 120, 150], self.dates, self.counts, 110, 2.0)
+        self.assertEqual(str(result[0]), "2025-01-03")
+        # 10 and 40 contributions left at 2 per day; allow a day of slack across midnight
+        self.assertIn((result[1] - today).astype(int), (5, 6))
+        self.assertIn((result[2] - today).astype(int), (20, 21))
+
+class TestContributionArrays(unittest.TestCase):
+    def test_uneven_weeks(self):
+        # GitHub's first and last weeks are usually partial
+        days = [
+            {"date": "2025-01-30", "contributionCount": 2},
+            {"date": "2025-01-31", "contributionCount": 0},
+            {"date": "2025-02-01", "contributionCount": 5},
+            {"date": "2025-02-02", "contributionCount": 1},
+            {"date": "2025-02-03", "contributionCount": 7},
+        ]
+        weeks = [{"contributionDays": days[:3]}, {"contributionDays": []}, {"contributionDays": days[3:]}]
+        dates, counts = get_contribution_arrays(weeks)
+        self.assertEqual(dates.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(counts.dtype, np.int32)
+        self.assertEqual([str(d) for d in dates], [day["date"] for day in days])
+        self.assertEqual(counts.tolist(), [day["contributionCount"] for day in days])
+
+    def test_no_weeks(self):
+        dates, counts = get_contribution_arrays([])
+        self.assertEqual(dates.size, 0)
+        self.assertEqual(counts.size, 0)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -1,223 +1,389 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "https://api.github.com/graphql"
+CACHE_TTL = 3600 # GitHub data is served from cache for an hour
+STAR_CACHE_TTL = 86400 # Star count changes slowly, refresh once a day
+REQUEST_TIMEOUT = 30 # Seconds; contribution history is split into small batches, so no request is very large
+YEARS_PER_REQUEST = 4 # Yearly contribution ranges per GraphQL request, keeping each well within GitHub's resource limits
+CACHE_MAX_ENTRIES = 64 # Per-user responses kept in memory; oldest are evicted past this
 
-@st.cache_data(ttl=300)
-def fetch_data_for_duration(username: str, token: str, from_date: str, to_date: str):
+@st.cache_resource(show_spinner=False)
+def get_session() -> requests.Session:
     """
-    Fetch user data from GitHub GraphQL API.
+    Returns the HTTP session shared by every fetcher. Created once per process and cached,
+    so TCP/TLS connections to GitHub are reused across reruns and sessions.
+
+    Returns:
+        requests.Session: Session with connection pooling and retries on transient gateway errors.
+    """
+    session = requests.Session()
+    # GraphQL queries are read-only, so POSTs are safe to retry. Only failed connections and gateway
+    # errors are retried: a read timeout already cost REQUEST_TIMEOUT and is surfaced right away
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False
+        )
+    ))
+    # Ask for compressed JSON explicitly; brotli is left out as decoding it needs an extra package
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+# GraphQL queries are built once; per-call values go in as variables.
+# The summary totals are skipped when $includeTotals is false, for callers that only need the calendar.
+CONTRIBUTION_FIELDS = """
+fragment ContributionFields on ContributionsCollection {
+  restrictedContributionsCount @include(if: $includeTotals)
+  totalCommitContributions @include(if: $includeTotals)
+  totalPullRequestContributions @include(if: $includeTotals)
+  totalIssueContributions @include(if: $includeTotals)
+  contributionCalendar {
+    totalContributions
+    weeks {
+      contributionDays {
+        contributionCount
+        date
+      }
+    }
+  }
+}
+"""
+
+# Just the join date, so the contribution history can start without waiting on the heavier user query
+CREATED_AT_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    createdAt
+  }
+}
+"""
+
+USER_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    name
+    bio
+    location
+    createdAt
+    avatarUrl(size: 160)
+    followers {
+      totalCount
+    }
+    following {
+      totalCount
+    }
+    repositories(first: 100, ownerAffiliations: OWNER, isFork: false) {
+      totalCount
+      edges {
+        node {
+          languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+            edges {
+              size
+              node {
+                name
+                color
+              }
+            }
+          }
+        }
+      }
+    }
+    contributionsCollection {
+      totalCommitContributions
+      totalPullRequestContributions
+      totalIssueContributions
+    }
+  }
+}
+"""
+
+class FetchError(Exception):
+    """Raised inside the cached fetchers when GitHub returns no usable data, so the failure is not cached."""
+
+# Failures the public fetchers turn into {"errors": ...} responses
+FETCH_ERRORS = (requests.exceptions.RequestException, FetchError)
+
+def _post_graphql(token: str, query: str, variables: dict) -> dict:
+    """
+    Sends a GraphQL query through the shared session.
 
     Args:
-        username (str): GitHub username.
         token (str): GitHub personal access token.
+        query (str): GraphQL document.
+        variables (dict): Values for the query's variables.
 
     Returns:
-        dict: JSON response from GitHub API containing user data or error message.
+        dict: Parsed JSON response.
+
+    Raises:
+        requests.exceptions.RequestException: On network or HTTP errors.
+        FetchError: If the response is not JSON or carries GraphQL errors.
     """
     headers = {"Authorization": f"Bearer {token}"}
-    query = f"""
-    {{ 
-      user(login: "{username}") {{
-        createdAt
-        contributionsCollection(from: "{from_date}T00:00:00Z", to: "{to_date}T23:59:59Z") {{
-          restrictedContributionsCount
-          totalCommitContributions
-          totalPullRequestContributions
-          totalIssueContributions
-          contributionCalendar {{
-            totalContributions
-            weeks {{
-              contributionDays {{
-                contributionCount
-                date
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-    """
+    response = get_session().post(BASE_URL, json={"query": query, "variables": variables}, headers=headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
     try:
-        response = requests.post(BASE_URL, json={"query": query}, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {"errors": str(e)}
+        result = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise FetchError(f"Invalid JSON from GitHub: {e}") from e
+    if "errors" in result:
+        raise FetchError(result["errors"])
+    return result
+
+# Each public fetcher wraps a cached one that raises on failure. Streamlit does not cache exceptions,
+# so only successful responses are kept for CACHE_TTL and a failed fetch is retried on the next call.
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_user_data(username: str, token: str) -> dict:
+    return _post_graphql(token, USER_QUERY, {"login": username})
 
-@st.cache_data(ttl=300)    
 def fetch_user_data(username: str, token: str):
     """
-    Fetch user data from GitHub GraphQL API.
+    Fetch user data from GitHub GraphQL API, including the language sizes of up to 100 owned repositories.
 
     Args:
         username (str): GitHub username.
         token (str): GitHub personal access token.
 
     Returns:
-        dict: JSON response from GitHub API containing user data or error message.
-    """
-    headers = {"Authorization": f"Bearer {token}"}
-    query = f"""
-    {{
-        user(login: "{username}") {{
-            name
-            bio
-            location
-            createdAt
-            avatarUrl
-            followers {{
-                totalCount
-            }}
-            following {{
-                totalCount
-            }}
-            repositories(ownerAffiliations: OWNER, isFork: false){{
-                totalCount
-            }}
-            contributionsCollection {{
-                totalCommitContributions
-                totalPullRequestContributions
-                totalIssueContributions
-                }}
-        }}
-    }}
+        dict: JSON response from GitHub API containing user and repository data or error message.
     """
     try:
-        response = requests.post(BASE_URL, json={"query": query}, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return _fetch_user_data(username, token)
+    except FETCH_ERRORS as e:
         return {"errors": str(e)}
 
-@st.cache_data(ttl=300)
-def fetch_repo_data(username: str, token: str):
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_created_at(username: str, token: str) -> dict:
+    return _post_graphql(token, CREATED_AT_QUERY, {"login": username})
+
+def fetch_created_at(username: str, token: str):
     """
-    Fetch repository data from GitHub GraphQL API.
+    Fetch only the account creation date from GitHub GraphQL API.
 
     Args:
         username (str): GitHub username.
         token (str): GitHub personal access token.
 
     Returns:
-        dict: JSON response from GitHub API containing repository data or error message.
-    """
-    headers = {"Authorization": f"Bearer {token}"}
-    query = f"""
-    {{
-        user(login: "{username}") {{
-            repositories(first: 100, ownerAffiliations: OWNER, isFork: false) {{
-                totalCount
-                edges {{
-                    node {{
-                        name
-                        primaryLanguage {{
-                            name
-                            color
-                        }}
-                    }}
-                }}
-            }}
-        }}
-    }}
+        dict: JSON response from GitHub API containing `createdAt` or error message.
     """
     try:
-        response = requests.post(BASE_URL, json={"query": query}, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return _fetch_created_at(username, token)
+    except FETCH_ERRORS as e:
         return {"errors": str(e)}
 
-@st.cache_data(ttl=300)
-def fetch_contribution_data(username: str, token: str):
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_multi_range(username: str, token: str, ranges: dict, include_totals: bool = True) -> dict:
+    # Only the aliases vary between calls; dates and login are passed as variables
+    params = "".join(f", ${alias}From: DateTime!, ${alias}To: DateTime!" for alias in ranges)
+    collections = "".join(
+        f"""
+    {alias}: contributionsCollection(from: ${alias}From, to: ${alias}To) {{
+      ...ContributionFields
+    }}"""
+        for alias in ranges
+    )
+    query = f"""
+query($login: String!, $includeTotals: Boolean!{params}) {{
+  user(login: $login) {{
+    createdAt{collections}
+  }}
+}}
+""" + CONTRIBUTION_FIELDS
+    variables = {"login": username, "includeTotals": include_totals}
+    for alias, (from_date, to_date) in ranges.items():
+        variables[f"{alias}From"] = f"{from_date}T00:00:00Z"
+        variables[f"{alias}To"] = f"{to_date}T23:59:59Z"
+    result = _post_graphql(token, query, variables)
+    user = result.get("data", {}).get("user")
+    if not user:
+        raise FetchError(f"User {username} not found")
+
+    # Split the aliased collections back into individual responses
+    return {
+        alias: {
+            "data": {
+                "user": {
+                    "createdAt": user["createdAt"],
+                    "contributionsCollection": user[alias]
+                }
+            }
+        }
+        for alias in ranges
+    }
+
+def fetch_multi_range(username: str, token: str, ranges: dict, include_totals: bool = True):
     """
-    Fetch all-time contribution data from GitHub GraphQL API by iterating through years.
+    Fetch contribution data for several date ranges in a single GraphQL request using aliases.
 
     Args:
         username (str): GitHub username.
         token (str): GitHub personal access token.
+        ranges (dict): Mapping of alias to a (from_date, to_date) tuple in 'YYYY-MM-DD' format.
+            Aliases must be valid GraphQL names (e.g. "lastYear", "y2024").
+        include_totals (bool): Also fetch the restricted/commit/PR/issue totals of each range.
+            Pass False when only the contribution calendar is used.
 
     Returns:
-        dict: Aggregated JSON-like response containing all-time contribution data.
+        dict: Mapping of each alias to `{"data": {"user": {"createdAt", "contributionsCollection"}}}` holding that range's
+            collection, or error message.
     """
+    try:
+        return _fetch_multi_range(username, token, ranges, include_totals)
+    except FETCH_ERRORS as e:
+        return {"errors": str(e)}
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_contribution_data(username: str, token: str) -> dict:
     # 1. Get user's creation date
-    user_info = fetch_user_data(username, token)
-    if "errors" in user_info:
-        return user_info
+    user_info = _fetch_created_at(username, token)
+
+    created_at_str = user_info['data']['user']['createdAt']
+    created_at = datetime.fromisoformat(created_at_str.rstrip("Z"))
+    now = datetime.now() # Read once so the last range cannot straddle midnight
+    start_year = created_at.year
+    end_year = now.year
     
-    try:
-        created_at_str = user_info['data']['user']['createdAt']
-        created_at = datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
-        start_year = created_at.year
-        end_year = datetime.now().year
+    all_weeks = []
+    total_contributions = 0
+    restricted_contributions = 0
+    total_commits = 0
+    total_prs = 0
+    total_issues = 0
+    
+    # 2. Build one range per year (GitHub GraphQL limit is 1 year per contributionsCollection)
+    ranges = {}
+    for year in range(start_year, end_year + 1):
+        # First year starts from account creation date
+        if year == start_year:
+            from_date = created_at.strftime("%Y-%m-%d")
+        else:
+            from_date = f"{year}-01-01"
+
+        # Last year ends at current date
+        if year == end_year:
+            to_date = now.strftime("%Y-%m-%d")
+        else:
+            to_date = f"{year}-12-31"
         
-        all_weeks = []
-        total_contributions = 0
-        restricted_contributions = 0
-        total_commits = 0
-        total_prs = 0
-        total_issues = 0
+        ranges[f"y{year}"] = (from_date, to_date)
+
+    # 3. Fetch the years in small batches, concurrently. Batches run oldest first, so only the
+    # one holding the current year changes from day to day; the others stay cached.
+    years = list(ranges)
+    batches = [
+        {alias: ranges[alias] for alias in years[i:i + YEARS_PER_REQUEST]}
+        for i in range(0, len(years), YEARS_PER_REQUEST)
+    ]
+    # A failed batch raises here, so the history is never cached with years missing;
+    # the batches that succeeded stay cached and only the failed one is fetched again
+    range_data = {}
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        for result in executor.map(lambda batch: _fetch_multi_range(username, token, batch), batches):
+            range_data.update(result)
+
+    for year_data in range_data.values():
+        collection = year_data["data"]["user"]["contributionsCollection"]
+        calendar = collection["contributionCalendar"]
         
-        # 2. Fetch data year by year (GitHub GraphQL limit is 1 year per request)
-        for year in range(start_year, end_year + 1):
-            # First year starts from account creation date
-            if year == start_year:
-                from_date = created_at.strftime("%Y-%m-%d")
-            else:
-                from_date = f"{year}-01-01"
-
-            # Last year ends at current date
-            if year == end_year:
-                to_date = datetime.now().strftime("%Y-%m-%d")
-            else:
-                to_date = f"{year}-12-31"
+        all_weeks.extend(calendar.get("weeks", []))
+        total_contributions += calendar.get("totalContributions", 0)
+        restricted_contributions += collection.get("restrictedContributionsCount", 0)
+        total_commits += collection.get("totalCommitContributions", 0)
+        total_prs += collection.get("totalPullRequestContributions", 0)
+        total_issues += collection.get("totalIssueContributions", 0)
             
-            year_data = fetch_data_for_duration(username, token, from_date, to_date)
-            
-            if "data" in year_data and year_data["data"]["user"]:
-                collection = year_data["data"]["user"]["contributionsCollection"]
-                calendar = collection["contributionCalendar"]
-                
-                all_weeks.extend(calendar.get("weeks", []))
-                total_contributions += calendar.get("totalContributions", 0)
-                restricted_contributions += collection.get("restrictedContributionsCount", 0)
-                total_commits += collection.get("totalCommitContributions", 0)
-                total_prs += collection.get("totalPullRequestContributions", 0)
-                total_issues += collection.get("totalIssueContributions", 0)
-            elif "errors" in year_data:
-                return year_data
-                
-        # 3. Return aggregated structure compatible with process_contribution_data
-        return {
-            "data": {
-                "user": {
-                    "contributionsCollection": {
-                        "restrictedContributionsCount": restricted_contributions,
-                        "totalCommitContributions": total_commits,
-                        "totalPullRequestContributions": total_prs,
-                        "totalIssueContributions": total_issues,
-                        "contributionCalendar": {
-                            "totalContributions": total_contributions,
-                            "weeks": all_weeks
-                        }
+    # 4. Return aggregated structure compatible with process_contribution_data
+    return {
+        "data": {
+            "user": {
+                "contributionsCollection": {
+                    "restrictedContributionsCount": restricted_contributions,
+                    "totalCommitContributions": total_commits,
+                    "totalPullRequestContributions": total_prs,
+                    "totalIssueContributions": total_issues,
+                    "contributionCalendar": {
+                        "totalContributions": total_contributions,
+                        "weeks": all_weeks
                     }
                 }
             }
         }
-    except Exception as e:
+    }
+
+def fetch_contribution_data(username: str, token: str):
+    """
+    Fetch all-time contribution data from GitHub GraphQL API, a few aliased yearly ranges per request.
+
+    Args:
+        username (str): GitHub username.
+        token (str): GitHub personal access token.
+
+    Returns:
+        dict: Aggregated JSON-like response containing all-time contribution data.
+    """
+    try:
+        return _fetch_contribution_data(username, token)
+    except Exception as e: # Malformed responses included
         return {"errors": str(e)}
 
 
-@st.cache_data(ttl=300)
+def fetch_all_data(username: str, token: str):
+    """
+    Fetch contribution and user data concurrently.
+
+    The contribution history reads the join date through `fetch_created_at`, so it shares no cached call
+    with `fetch_user_data` and neither waits on the other. Total latency is roughly that of the slower of the two;
+    repository languages are part of the user data response.
+
+    Args:
+        username (str): GitHub username.
+        token (str): GitHub personal access token.
+
+    Returns:
+        tuple: (contribution data, user data) as returned by the individual fetchers.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cont_future = executor.submit(fetch_contribution_data, username, token)
+        user_future = executor.submit(fetch_user_data, username, token)
+        return cont_future.result(), user_future.result()
+
+
+def clear_cached_data():
+    """
+    Clears cached GitHub responses so the next run fetches fresh data. The star count cache is kept.
+    """
+    for fetcher in (_fetch_created_at, _fetch_user_data, _fetch_multi_range, _fetch_contribution_data):
+        fetcher.clear()
+
+
+@st.cache_data(ttl=STAR_CACHE_TTL, show_spinner=False)
+def _fetch_star_count() -> int:
+    url = "https://api.github.com/repos/TheCarbun/GitHub-Stat-Checker"
+    response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status() # Rate-limited responses carry no count and must not be cached
+    return orjson.loads(response.content).get('stargazers_count', 0)
+
 def fetch_star_count():
     """
     Returns the number of stars for the GitHub-Stat-Checker repository.
     """
-    url = "https://api.github.com/repos/TheCarbun/GitHub-Stat-Checker"
     try:
-        response = requests.get(url).json()
-        return response.get('stargazers_count', 0)
-    except requests.exceptions.RequestException as e:
+        return _fetch_star_count()
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error fetching stars: {e}")
         return 0
\ No newline at end of file
@@ -1,5 +1,8 @@
+import streamlit as st
+import numpy as np
 from datetime import datetime
-from utils.util import get_streaks, get_highest_contribution, get_active_days, get_todays_commits, format_duration, is_less_than_2_months_old, format_iso_date, format_date_ddmmyyyy
+from collections import Counter
+from utils.util import get_streaks, get_contribution_arrays, get_contribution_counts, get_highest_contribution, get_active_days, get_todays_commits, format_duration, is_less_than_2_months_old, format_iso_date, format_date_ddmmyyyy
 
 def process_contribution_data(data: dict):
     """
@@ -14,29 +17,32 @@ def process_contribution_data(data: dict):
     try:
         contributions_collection = data['data']['user']['contributionsCollection']
         calendar = contributions_collection['contributionCalendar']
-        days = [day for week in calendar['weeks'] for day in week['contributionDays']]
         weeks = calendar.get("weeks", [])
         
         # GitHub GraphQL returns contributionCalendar.totalContributions as combined public + restricted counts.
-        total_contributions = calendar.get('totalContributions', 0)
-        private_contributions = contributions_collection.get('restrictedContributionsCount', 0)
+        # Normalize missing/null values to ints before doing arithmetic on them.
+        total_contributions = int(calendar.get('totalContributions') or 0)
+        private_contributions = int(contributions_collection.get('restrictedContributionsCount') or 0)
         public_contributions = max(total_contributions - private_contributions, 0)
         
         total_commits = contributions_collection.get('totalCommitContributions', 0)
         total_prs = contributions_collection.get('totalPullRequestContributions', 0)
         total_issues = contributions_collection.get('totalIssueContributions', 0)
             
+        # Dates and counts as arrays in a single walk over the weeks, shared by the reductions below
+        dates, counts = get_contribution_arrays(weeks)
+
         # Calculate highest contribution
-        highest_contribution, highest_contribution_date = get_highest_contribution(days)
+        highest_contribution, highest_contribution_date = get_highest_contribution(dates, counts)
         
         # Calculate streaks with validation
-        current_streak, longest_streak = get_streaks(days)
+        current_streak, longest_streak = get_streaks(dates, counts)
 
         # Calculate Active Days
-        active_days = get_active_days(weeks)
+        active_days = get_active_days(counts)
 
         # Find today's commits
-        today_commits = get_todays_commits(weeks)
+        today_commits = get_todays_commits(dates, counts)
 
         return {
             "total_contributions": total_contributions,
@@ -51,7 +57,8 @@ def process_contribution_data(data: dict):
             "current_streak": current_streak,
             "longest_streak": longest_streak,
             "active_days": active_days,
-            "days": days
+            "dates": dates,
+            "counts": counts
         }
     except (KeyError, TypeError) as e:
         print(f"Error processing contribution data: {str(e)}")
@@ -62,9 +69,11 @@ def process_contribution_data(data: dict):
             "highest_contribution": 0,
             "current_streak": 0,
             "longest_streak": 0,
-            "days": []
+            "dates": np.array([], dtype="datetime64[D]"),
+            "counts": np.array([], dtype=np.int32)
         }
 
+@st.cache_data(show_spinner=False)
 def process_language_data(data: dict):
     """
     Process the language data from GitHub API response.
@@ -73,27 +82,27 @@ def process_language_data(data: dict):
         data (dict): JSON response from GitHub API containing repository data.
 
     Returns:
-        dict: Dictionary of languages with their usage counts and colors.
+        dict: Dictionary of languages with their total size in bytes and colors, largest first.
     """
     try:
         # Get repositories from the user data
         repositories = data['data']['user']['repositories']['edges']
         
-        # Process language data
-        language_data = {}
+        # Sum the bytes of code written in each language across all repositories
+        language_sizes = Counter()
+        colors = {}
         
-        for edge in repositories:
-            repo = edge['node']
-            if repo['primaryLanguage']:
-                language = repo['primaryLanguage']['name']
-                color = repo['primaryLanguage'].get('color', '#808080')  # Default to grey if no color
-
-                if language not in language_data:
-                    language_data[language] = {'count': 0, 'color': color}
-
-                language_data[language]['count'] += 1
+        for repo in repositories:
+            for edge in repo['node']['languages']['edges']:
+                language = edge['node']
+                language_sizes[language['name']] += edge['size']
+                colors.setdefault(language['name'], language.get('color') or '#808080')  # Default to grey if no color
         
-        return language_data
+        # Largest languages first
+        return {
+            language: {'size': size, 'color': colors[language]}
+            for language, size in language_sizes.most_common()
+        }
     except Exception as e:
         print(f"Error processing language data: {str(e)}")
         return None
@@ -116,22 +125,25 @@ def process_user_data(data: dict):
         formatted_date = format_iso_date(created_at) 
 
         less_than_2_months_old = is_less_than_2_months_old(created_at)
-        github_days = (datetime.now() - datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")).days
+        github_days = (datetime.now() - datetime.fromisoformat(created_at.rstrip("Z"))).days
 
         joined_since = format_duration(created_at)
 
+        # Bind the nested connections once instead of chaining lookups per field
+        contributions = user_data.get("contributionsCollection") or {}
+
         return {
             "name": user_data.get("name", ""),
             "bio": user_data.get("bio", ""),
             "location": user_data.get("location", ""),
             "created_at": created_at,
             "avatar_url": user_data.get("avatarUrl"),
-            "followers": user_data.get("followers").get("totalCount", 0),
-            "following": user_data.get("following").get("totalCount", 0),
-            "repositories": user_data.get("repositories").get("totalCount", 0),
-            "total_commits": user_data.get("contributionsCollection").get("totalCommitContributions", 0),
-            "total_pullrequests": user_data.get("contributionsCollection").get("totalPullRequestContributions", 0),
-            "total_issues": user_data.get("contributionsCollection").get("totalIssueContributions", 0),
+            "followers": (user_data.get("followers") or {}).get("totalCount", 0),
+            "following": (user_data.get("following") or {}).get("totalCount", 0),
+            "repositories": (user_data.get("repositories") or {}).get("totalCount", 0),
+            "total_commits": contributions.get("totalCommitContributions", 0),
+            "total_pullrequests": contributions.get("totalPullRequestContributions", 0),
+            "total_issues": contributions.get("totalIssueContributions", 0),
             "formatted_date": formatted_date,
             "joined_since": joined_since,
             "github_days": github_days,
@@ -144,6 +156,7 @@ def process_user_data(data: dict):
         }
     
    
+@st.cache_data(show_spinner=False)
 def analyze_contributions(data):
     """Analyzes GitHub contribution data and provides key insights."""
     if not data:
@@ -151,17 +164,16 @@ def analyze_contributions(data):
 
     try:
         contributions = data["data"]["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
+        counts = get_contribution_counts(contributions)
         # Sum of all contributions in this time period
-        total_contributions = sum(
-            day["contributionCount"] for week in contributions for day in week["contributionDays"]
-        )
+        total_contributions = int(counts.sum())
         # Total no. of days in this time period
-        total_days = sum(1 for week in contributions for day in week["contributionDays"])
+        total_days = counts.size
 
         contribution_rate = total_contributions / total_days  # Contributions per day
 
         # Total no. of days user pushed a commit
-        active_days = get_active_days(contributions)
+        active_days = get_active_days(counts)
 
         return {
             "total_contributions": total_contributions,
@@ -2,7 +2,7 @@ from PIL.ImageOps import expand
 import streamlit as st
 import json
 from streamlit import session_state as sst
-from utils.fetch_github_data import fetch_star_count
+from utils.fetch_github_data import fetch_star_count, clear_cached_data
 import requests
 
 TOKEN = st.secrets["token"]
@@ -77,6 +77,9 @@ def initialize_sst():
     - 'user_token': an empty string
     - 'token_present': False
     - 'button_pressed': False
+    - 'last_fetch_key': None
+    - 'last_fetch_time': 0.0
+    - 'last_fetch': None
     """
 
     # Initializing session state
@@ -88,6 +91,12 @@ def initialize_sst():
         sst.token_present = False
     if 'button_pressed' not in sst:
         sst.button_pressed = False
+    if 'last_fetch_key' not in sst:
+        sst.last_fetch_key = None # (username, token, date) of the results held in last_fetch
+    if 'last_fetch_time' not in sst:
+        sst.last_fetch_time = 0.0 # time.time() when the results in last_fetch were fetched
+    if 'last_fetch' not in sst:
+        sst.last_fetch = None
 
 def title_bar():
     """
@@ -108,15 +117,19 @@ def title_bar():
                         help=f"Give a star to this repository on GitHub. Current stars: {stars}",
                         use_container_width=True)
 
+@st.fragment
 def form():
     """
     ### Creates a form in a Streamlit container for GitHub username and optional personal access token input.
 
+    Runs as a fragment, so typing or toggling only reruns the form. Pressing "Analyze" reruns the full app.
+
     The form includes:
     - A text input for the GitHub username.
     - A toggle to indicate if the user has a GitHub Access Token.
     - A conditional text input for the GitHub Personal Access Token if the toggle is enabled.
     - A button to trigger the analysis.
+    - A button to refresh cached GitHub data once an analysis has run.
 
     Updates the global state variables `sst.username`, `sst.token_present`, `sst.user_token`, `sst.token`, and `sst.button_pressed` based on user input.
     """
@@ -138,6 +151,13 @@ def form():
     
     if form.button("Analyze", type="primary"):
         sst.button_pressed = True
+        st.rerun() # Rerun the whole app so the dashboard picks up the new input
+
+    # GitHub responses are cached for an hour, allow fetching fresh data on demand
+    if sst.button_pressed and form.button("Refresh Data", icon=":material/refresh:", help="Fetch the latest data from GitHub instead of the cached copy."):
+        clear_cached_data()
+        sst.last_fetch_key = None
+        st.rerun()
 
 def how_to_use():
     """
@@ -209,9 +229,16 @@ def growth_stats(total_contributions:int, contribution_rate:int, active_days:int
         border=True
         )
 
-def whatsnew():
+@st.cache_data(show_spinner=False)
+def load_whats_new() -> list:
+    """
+    ### Loads the "What's New" entries. The file only changes on deploy, so it is read once and cached.
+    """
     with open("utils/whats_new.json", "r", encoding="UTF-8") as file:
-        whats_new = json.load(file)
+        return json.load(file)
+
+def whatsnew():
+    whats_new = load_whats_new()
     
     with st.expander("See What's New"):
         for items in whats_new:
@@ -1,23 +1,38 @@
-from datetime import datetime, timedelta
+import streamlit as st
+import numpy as np
+from datetime import date, datetime
 from dateutil.relativedelta import relativedelta
 
-def get_streaks(days:list):
-    current_streak = 0
-    longest_streak = 0
-    last_contribution_date = None
+month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def get_streaks(dates:np.ndarray, counts:np.ndarray):
+    """
+    Calculates the current and longest contribution streaks from runs of consecutive active days.
+
+    Args:
+        dates (np.ndarray): datetime64[D] array of consecutive contribution days, as returned by `get_contribution_arrays`.
+        counts (np.ndarray): Contribution count of each day, as returned by `get_contribution_arrays`.
+
+    Returns:
+        tuple: (current_streak, longest_streak) in days.
+    """
     try:
-        for day in days:
-            date = datetime.strptime(day["date"], "%Y-%m-%d")
-            count = day.get('contributionCount', 0)
-            if count > 0:
-                if last_contribution_date and (date - last_contribution_date).days > 1:
-                    current_streak =0
-                current_streak += 1
-                longest_streak = max(longest_streak, current_streak)
-                last_contribution_date = date
-        
+        active = counts > 0
+        if not active.any():
+            return 0, 0
+
+        # Runs of active days start and end where the zero-padded mask changes value
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
+        run_starts, run_ends = edges[::2], edges[1::2]
+        run_lengths = run_ends - run_starts
+
+        longest_streak = int(run_lengths.max())
+        current_streak = int(run_lengths[-1])
+
+        # Streak is still alive if the last contribution was today or yesterday
+        last_contribution_date = dates[run_ends[-1] - 1].astype(date)
         today = datetime.today().date()
-        if last_contribution_date and (today - last_contribution_date.date()).days > 1:
+        if (today - last_contribution_date).days > 1:
             current_streak = 0
 
     except Exception as e:
@@ -26,42 +41,76 @@ def get_streaks(days:list):
         longest_streak = 0
     return current_streak, longest_streak
 
-def get_highest_contribution(days:list):
-    
-    try:
-        highest_day = max(days, key=lambda day: day['contributionCount'])
-        highest_contribution = highest_day['contributionCount']
-        highest_contribution_date = format_date_ddmmyyyy(highest_day['date'])
-        
-    except (ValueError, KeyError):
-        highest_contribution = 0
-        highest_contribution_date = None
+def get_contribution_arrays(weeks:list):
+    """
+    Walks the GraphQL weeks once, parsing dates and counts straight into a NumPy record array without flattening the days first.
+
+    Args:
+        weeks (list): contributionCalendar weeks from GraphQL.
+
+    Returns:
+        tuple: (dates, counts) as a datetime64[D] array and an int32 array, in calendar order.
+    """
+    # Each 'YYYY-MM-DD' string is parsed by NumPy as the record is filled
+    days = np.fromiter(
+        ((day["date"], day.get("contributionCount", 0)) for week in weeks for day in week["contributionDays"]),
+        dtype=[("date", "datetime64[D]"), ("count", np.int32)]
+    )
+    # Copy the fields out so callers get contiguous arrays
+    return days["date"].copy(), days["count"].copy()
+
+def get_contribution_counts(weeks:list) -> np.ndarray:
+    """
+    Materializes the contribution count of every day as a NumPy array, straight from the GraphQL weeks.
+
+    Args:
+        weeks (list): contributionCalendar weeks from GraphQL.
+
+    Returns:
+        np.ndarray: int32 array of contribution counts, in calendar order.
+    """
+    n = sum(len(week["contributionDays"]) for week in weeks)
+    return np.fromiter(
+        (day.get("contributionCount", 0) for week in weeks for day in week["contributionDays"]),
+        dtype=np.int32, count=n
+    )
+
+def downcast_counts(counts) -> np.ndarray:
+    """
+    Casts non-negative counts to the smallest unsigned integer dtype that holds them, so charts ship fewer bytes to the browser.
+
+    Args:
+        counts (array-like): Non-negative integer counts.
+
+    Returns:
+        np.ndarray: The same values as uint8, uint16, uint32 or uint64.
+    """
+    counts = np.asarray(counts)
+    if counts.size == 0:
+        return counts
+    return counts.astype(np.min_scalar_type(int(counts.max())))
+
+def get_highest_contribution(dates:np.ndarray, counts:np.ndarray):
+    if counts.size == 0:
+        return 0, None
+
+    highest_index = int(counts.argmax())
+    highest_contribution = int(counts[highest_index])
+    highest_contribution_date = format_date_ddmmyyyy(str(dates[highest_index]))
     
     return highest_contribution, highest_contribution_date
 
-def get_active_days(weeks:list):
-    # Extract contribution days
-    try:
-        contribution_days = [day["date"] for week in weeks for day in week["contributionDays"] if day["contributionCount"] > 0]
-        active_days = len(set(contribution_days))  # Unique active contribution days
-    except Exception as e:
-        print(e)
-        active_days = 0
+def get_active_days(counts:np.ndarray):
+    # GitHub returns each date once, so active days are the non-zero counts
+    return int(np.count_nonzero(counts))
 
-    return active_days
-
-def get_todays_commits(weeks:list):
+def get_todays_commits(dates:np.ndarray, counts:np.ndarray):
     try:
-        # Today's Date in format of how it's fetched from GraohQL
-        today = datetime.now().strftime("%Y-%m-%d") 
+        # Today's date as the same datetime64[D] unit the dates were parsed into
+        today = np.datetime64(datetime.now().date(), "D")
 
         # Find today's contributions
-        today_commits = sum(
-            day["contributionCount"]
-            for week in weeks
-            for day in week["contributionDays"]
-            if day["date"] == today
-        )
+        today_commits = int(counts[dates == today].sum())
     except Exception as e:
         print(e)
         today_commits = 0
@@ -79,7 +128,7 @@ def format_duration(iso_date:str) -> str:
     Returns:
         str: The formatted duration string (e.g., "2 years 3 months 5 days").
     """
-    created_at = datetime.strptime(iso_date, "%Y-%m-%dT%H:%M:%SZ")
+    created_at = datetime.fromisoformat(iso_date.rstrip("Z"))
     now = datetime.now()
     delta = now - created_at
 
@@ -107,10 +156,35 @@ def format_date_ddmmyyyy(date:str) -> str:
     Returns:
         str: The formatted date string (e.g., "7th Feb, 2025").
     """
-    date_obj = datetime.strptime(date, '%Y-%m-%d')
+    date_obj = datetime.fromisoformat(date)
     formated_date = date_obj.strftime("{day} %b, %Y").replace("{day}", str(date_obj.day) + ("st" if date_obj.day in [1, 21, 31] else "nd" if date_obj.day in [2, 22] else "rd" if date_obj.day in [3, 23] else "th"))
     return formated_date
 
+def format_dates_ddmmyyyy(dates:np.ndarray) -> list:
+    """
+    Batched `format_date_ddmmyyyy`: formats a datetime64 array as 'DDth MMM, YYYY' with integer arithmetic instead of per-date strftime.
+
+    Args:
+        dates (np.ndarray): datetime64 dates; NaT entries are allowed.
+
+    Returns:
+        list: The formatted date strings (e.g., "7th Feb, 2025"), "" for NaT.
+    """
+    days_arr = np.asarray(dates, dtype="datetime64[D]")
+    months_arr = days_arr.astype("datetime64[M]")
+    years = months_arr.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = months_arr.astype(np.int64) % 12
+    days = (days_arr - months_arr).astype(np.int64) + 1
+
+    formatted = []
+    for is_nat, day, month, year in zip(np.isnat(days_arr).tolist(), days.tolist(), months.tolist(), years.tolist()):
+        if is_nat:
+            formatted.append("")
+            continue
+        suffix = "st" if day in (1, 21, 31) else "nd" if day in (2, 22) else "rd" if day in (3, 23) else "th"
+        formatted.append(f"{day}{suffix} {month_names[month]}, {year}")
+    return formatted
+
 def format_iso_date(iso_date:str) -> str:
     """
     Formats an ISO date string to 'DDth MMM, YYYY'.
@@ -121,7 +195,7 @@ def format_iso_date(iso_date:str) -> str:
     Returns:
         str: The formatted date string (e.g., "7th Feb, 202
     """
-    dt = datetime.strptime(iso_date, "%Y-%m-%dT%H:%M:%SZ")
+    dt = datetime.fromisoformat(iso_date.rstrip("Z"))
     return dt.strftime("{day} %b, %Y").replace("{day}", str(dt.day) + ("st" if dt.day in [1, 21, 31] else "nd" if dt.day  in [2, 22] else "rd" if dt.day in [3, 23] else "th"))
 
 def is_less_than_2_months_old(iso_date:str) -> bool:
@@ -134,13 +208,14 @@ def is_less_than_2_months_old(iso_date:str) -> bool:
     Returns:
         bool: True if the date is less than 2 months old, False otherwise.
     """
-    created_date = datetime.strptime(iso_date, "%Y-%m-%dT%H:%M:%SZ")
+    created_date = datetime.fromisoformat(iso_date.rstrip("Z"))
     two_months_ago = datetime.now() - relativedelta(months=2)
     return created_date > two_months_ago
 
+@st.cache_resource(show_spinner=False)
 def load_css() -> str:
     """
-    Loads CSS stylesheet from local files.
+    Loads CSS stylesheet from local files. The file is read once per process and cached.
 
     Returns:
         str: The content of the CSS file.
@@ -158,59 +233,51 @@ def load_css() -> str:
     except Exception as e:
         print(f"❗Error loading stylesheet: {e}")
 
-def predict_days_to_milestone(current_contributions, milestone, contribution_rate):
-    """Predicts how many days are required to reach the milestone."""
+def predict_days_to_milestone(current_contributions, milestones, contribution_rate) -> np.ndarray:
+    """
+    Predicts how many days are required to reach each milestone, for every milestone in one NumPy expression.
+
+    Args:
+        current_contributions (int): Contributions so far.
+        milestones (array-like): Milestone commit targets.
+        contribution_rate (float): Daily contribution rate.
+
+    Returns:
+        np.ndarray: Days required per milestone; 0 if already reached, inf if the rate is not positive.
+    """
+    targets = np.asarray(milestones, dtype=np.float64)
     if contribution_rate <= 0:
-        return float('inf')  # Cannot reach milestone with zero contributions per day
-    remaining_contributions = milestone - current_contributions
-    if remaining_contributions <= 0:
-        return 0  # Already reached
-    days_required = remaining_contributions / contribution_rate
-    return days_required
+        return np.full(targets.shape, np.inf)  # Cannot reach milestones with zero contributions per day
+    return np.maximum(0.0, (targets - current_contributions) / contribution_rate)
 
 
-def get_milestone_dates(milestones, contributions, total_contributions, contribution_rate):
+def get_milestone_dates(milestones, dates:np.ndarray, counts:np.ndarray, total_contributions, contribution_rate) -> np.ndarray:
     """
-    Finds the exact dates when milestones were achieved from GraphQL data and predicts future ones.
+    Finds the exact dates when milestones were achieved and predicts future ones.
 
     Args:
     - milestones (list): List of milestone commit targets.
-    - contributions (list): Contribution data from GraphQL (weeks > contributionDays).
+    - dates (np.ndarray): datetime64[D] array of contribution days, as returned by `get_contribution_arrays`.
+    - counts (np.ndarray): Contribution count of each day, as returned by `get_contribution_arrays`.
     - total_contributions (int): Current total contributions.
     - contribution_rate (float): Daily contribution rate.
 
     Returns:
-    - dict: Milestone predictions with exact dates (if achieved) and estimated dates (if not achieved).
+    - np.ndarray: datetime64[D] date per milestone, exact if achieved and estimated if not; NaT if not achievable.
     """
-    milestone_dates = {}
-    cumulative_contributions = 0
-
-    # --- Traverse through contributions to find exact dates ---
-    for week in contributions:
-        for day in week["contributionDays"]:
-            contribution_count = day["contributionCount"]
-            date = day["date"]
-
-            if contribution_count > 0:
-                cumulative_contributions += contribution_count
+    targets = np.asarray(milestones)
+    milestone_dates = np.full(targets.shape, np.datetime64("NaT"), dtype="datetime64[D]")
 
-                # If a milestone is reached, store its exact date
-                for milestone in milestones:
-                    if milestone not in milestone_dates and cumulative_contributions >= milestone:
-                        milestone_dates[milestone] = date
+    # --- First day whose running total reaches each milestone ---
+    reached_at = np.searchsorted(np.cumsum(counts), targets, side="left")
+    achieved = reached_at < len(dates)
+    milestone_dates[achieved] = dates[reached_at[achieved]]
 
     # --- Predict future milestone dates ---
-    today = datetime.now()
     if contribution_rate > 0:
-        for milestone in milestones:
-            if milestone not in milestone_dates:  # Only predict if not already achieved
-                remaining_commits = milestone - total_contributions
-                days_to_milestone = remaining_commits / contribution_rate
-                milestone_dates[milestone] = (today + timedelta(days=days_to_milestone)).strftime("%Y-%m-%d")
-    else:
-        for milestone in milestones:
-            if milestone not in milestone_dates:
-                milestone_dates[milestone] = "Not achievable"
+        days_to_milestone = (targets[~achieved] - total_contributions) / contribution_rate
+        now = np.datetime64(datetime.now(), "s")
+        milestone_dates[~achieved] = (now + (days_to_milestone * 86400).astype("timedelta64[s]")).astype("datetime64[D]")
 
     return milestone_dates
 